@@ -18,14 +18,25 @@ depends_on = None
 
 def upgrade() -> None:
     # ### adding phone_number column to users ###
-    op.add_column(
-        table_name='users', 
-        column=sa.Column(
-            name='phone_number',
-            type_=sa.VARCHAR(length=50),
-            nullable=True
+    # run in its own short transaction and give up after 2 seconds of waiting
+    # for the users table lock instead of queueing every other query behind it.
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = '2s'")
+        op.add_column(
+            table_name='users', 
+            column=sa.Column(
+                name='phone_number',
+                type_=sa.VARCHAR(length=50),
+                nullable=True
+            )
         )
-    )
+        op.execute("RESET lock_timeout")
+    # a nullable column without default only changes the catalog.
+    # if it is ever made NOT NULL with a default, backfill existing rows
+    # in batches of short transactions before adding the constraint:
+    # UPDATE users SET phone_number = '' WHERE telegram_id IN (
+    #     SELECT telegram_id FROM users WHERE phone_number IS NULL LIMIT 1000
+    # ) repeated until no rows are updated.
     # ### end Alembic commands ###
 
 
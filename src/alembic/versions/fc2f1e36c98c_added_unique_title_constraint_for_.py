@@ -19,10 +19,17 @@ depends_on = None
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     # add unique key contraint on title column of products.
-    op.create_unique_constraint(
-        constraint_name='products_title_key',
-        table_name='products',
-        columns=['title']
+    # build the unique index concurrently so products stays readable and
+    # writable while it is built. CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS products_title_key "
+            "ON products (title)"
+        )
+    # attach the prebuilt index as the unique constraint without a rebuild.
+    op.execute(
+        "ALTER TABLE products "
+        "ADD CONSTRAINT products_title_key UNIQUE USING INDEX products_title_key"
     )
     # ### end Alembic commands ###
 
@@ -30,6 +37,7 @@ def upgrade() -> None:
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     # drop unique key contraint on title column of products.
+    # dropping the constraint drops its index as well.
     op.drop_constraint(
         constraint_name='products_title_key',
         table_name='products'
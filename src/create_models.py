@@ -3,13 +3,12 @@
 from datetime import datetime
 from typing import Optional, List
 from typing_extensions import Annotated
-from sqlalchemy.dialects.postgresql import TIMESTAMP, BIGINT, VARCHAR, INTEGER
-from sqlalchemy import DECIMAL
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+from sqlalchemy.dialects.postgresql import TIMESTAMP, BIGINT, VARCHAR, INTEGER, TEXT
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.sql.functions import func
-from sqlalchemy import ForeignKey, create_engine, URL
+from sqlalchemy import ForeignKey, Index, text
 
 
 # Base classes
@@ -66,22 +65,26 @@ int_pk = Annotated[int, mapped_column(
 )]
 
 # foreign column attribute.
+# PostgreSQL does not index foreign key columns by itself,
+# the tables using it declare a covering index on it instead.
 user_fk = Annotated[int, mapped_column(
     BIGINT,
     ForeignKey('users.telegram_id', ondelete='CASCADE')
 )]
 
-# string with 255 characters column attribute.
-str_255 = Annotated[str, mapped_column(VARCHAR(length=255))]
+# string column attribute.
+# TEXT is stored like VARCHAR but skips the length check on every write.
+str_text = Annotated[str, mapped_column(TEXT)]
 
 # column for description.
-desc = Annotated[str, mapped_column(VARCHAR(length=3000))]
+desc = Annotated[str, mapped_column(TEXT)]
 
 # column for language code.
-lang = Annotated[str, mapped_column(VARCHAR(10))]
+lang = Annotated[str, mapped_column(TEXT)]
 
-# column for cost.
-cost = Annotated[float, mapped_column(DECIMAL(precision=16, scale=4))]
+# column for cost in integer cents.
+# BIGINT is fixed width and cheaper to store and decode than NUMERIC.
+cost = Annotated[int, mapped_column(BIGINT)]
 
 
 # database objects as python classes.
@@ -102,17 +105,33 @@ class User(Base, TimestampMixin, TableNameMixin):
     """
 
     telegram_id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=False)
-    full_name: Mapped[str_255]
-    user_name: Mapped[Optional[str_255]]
+    full_name: Mapped[str_text]
+    user_name: Mapped[Optional[str_text]]
     phone_number: Mapped[Optional[str]] = mapped_column(type_=VARCHAR(length=50))
     language_code: Mapped[lang]
     referrer_id: Mapped[Optional[int]] = mapped_column(
         BIGINT,
-        ForeignKey('users.telegram_id', ondelete='SET NULL')
+        ForeignKey('users.telegram_id', ondelete='SET NULL'),
+        index=True
     )
 
     # reference all orders placed by the user.
-    orders: Mapped[List["Order"]] = relationship(back_populates="user")
+    # loaded on first access, queries walking orders choose their own eager loader.
+    orders: Mapped[List["Order"]] = relationship(back_populates="user", lazy="select")
+
+    __table_args__ = (
+        # trigram index for substring ILIKE searches on user name.
+        Index('ix_users_name_trgm', 'user_name',
+              postgresql_using='gin',
+              postgresql_ops={'user_name': 'gin_trgm_ops'}),
+        # partial index for latest english and ukranian users.
+        Index('ix_users_created_lang', 'created_at',
+              postgresql_where=text("language_code IN ('en', 'uk')")),
+        # covering index for index-only lookups of language code and name.
+        Index('ix_users_telegram_id', 'telegram_id',
+              unique=True,
+              postgresql_include=['language_code', 'full_name']),
+    )
 
 # Product
 class Product(Base, TimestampMixin, TableNameMixin):
@@ -123,10 +142,10 @@ class Product(Base, TimestampMixin, TableNameMixin):
         product_id (int): Primary key depicting products in database.
         title (str): Product name.
         description (str or optional): Product description.
-        price (float): Product price.
+        price (int): Product price in cents.
     """
     product_id: Mapped[int_pk]
-    title: Mapped[str_255] = mapped_column(unique=True)
+    title: Mapped[str_text] = mapped_column(unique=True)
     description: Mapped[Optional[desc]]
     price: Mapped[cost]
 
@@ -149,10 +168,18 @@ class Order(Base, TimestampMixin, TableNameMixin):
     user_id: Mapped[user_fk]
 
     # reference to user that place this order.
-    user: Mapped["User"] = relationship("User", back_populates="orders")
+    # loaded on first access, from the session if the user is already loaded.
+    user: Mapped["User"] = relationship("User", back_populates="orders", lazy="select")
 
     # reference to list of products for this order placed.
-    products: Mapped[List["OrderProduct"]] = relationship()
+    # loaded on first access, queries walking products choose their own eager loader.
+    products: Mapped[List["OrderProduct"]] = relationship(lazy="select")
+
+    __table_args__ = (
+        # covering index for joins to users and index-only counts of orders per user.
+        Index('ix_orders_user_id_order_id', 'user_id',
+              postgresql_include=['order_id']),
+    )
 
 # OrderProduct mapping many-many relationships.
 class OrderProduct(Base, TableNameMixin):
@@ -176,36 +203,32 @@ class OrderProduct(Base, TableNameMixin):
     product_id: Mapped[int] = mapped_column(
         INTEGER,
         ForeignKey('products.product_id', ondelete='RESTRICT'),
-        primary_key=True
+        primary_key=True,
+        index=True
     )
-    quantity: Mapped[int]
+    quantity: Mapped[int] = mapped_column(INTEGER, server_default=text("1"))
 
-    # reference to product placed in order.
-    product: Mapped["Product"] = relationship() 
+    __table_args__ = (
+        # covering index for index-only sums of quantity per order.
+        Index('ix_op_order_qty', 'order_id',
+              postgresql_include=['quantity']),
+    )
 
+    # reference to product placed in order.
+    # loaded on first access, from the session if the product is already loaded.
+    product: Mapped["Product"] = relationship(lazy="select")
 
-# connect to database engine
-url = URL.create(
-    # driver name = postgresql + the library we are using (psycopg2)
-    drivername="postgresql+psycopg2",
-    database='testuser',
-    username='testuser',
-    password='testpassword',
-    host='localhost',
-    port=5432
-)
-engine = create_engine(url=url)
 
 # Bind the engine to session maker.
-# session_pool = sessionmaker(bind=engine)
+# from db import get_engine, get_session_pool
 
 # create all python object to database in unrecommended way.
 
 # drop all tables associated with Base objects from database.
-# Base.metadata.drop_all(bind=engine)
+# Base.metadata.drop_all(bind=get_engine())
 # recreate all Base objects as tables in database.
-# Base.metadata.create_all(bind=engine)
+# Base.metadata.create_all(bind=get_engine())
 
 # connecting to database session.
-# with session_pool() as session:
+# with get_session_pool()() as session:
 #    pass
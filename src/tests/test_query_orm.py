@@ -0,0 +1,140 @@
+"""Tests of Repo against the database configured in the environment.
+
+The database has to be migrated to the latest alembic revision.
+Run from the src directory: python -m unittest discover tests
+Every test runs in a transaction rolled back afterwards, so the
+database is left as it was.
+"""
+import os
+import unittest
+from unittest import mock
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.exc import InvalidRequestError, OperationalError
+from sqlalchemy.orm import Session
+from create_models import User, Order, OrderProduct
+from query_orm import Repo, _build_url
+
+
+class RepoTestCase(unittest.TestCase):
+    """Base class giving each test a Repo on a rolled back transaction.
+
+
+    Attributes:
+    -----------
+        session (Session): Session joined to the outer transaction of the test.
+        repo (Repo): Repo reading and writing through the session.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine(url=_build_url())
+        try:
+            cls.engine.connect().close()
+        except OperationalError as error:
+            cls.engine.dispose()
+            raise unittest.SkipTest(f"database not available: {error}")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        # commits of Repo release a savepoint instead of
+        # committing the outer transaction rolled back below.
+        self.connection = self.engine.connect()
+        self.transaction = self.connection.begin()
+        self.session = Session(bind=self.connection,
+                               join_transaction_mode="create_savepoint")
+        self.repo = Repo(session=self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.transaction.rollback()
+        self.connection.close()
+
+    def count(self, entity) -> int:
+        """Counts rows of table of given entity.
+
+
+        Args:
+        -----
+            entity: Mapped class of the table to count.
+
+        Returns:
+        --------
+            int: Number of rows in the table.
+        """
+        return self.session.scalar(select(func.count()).select_from(entity))
+
+
+class SeedFakeDataTest(RepoTestCase):
+    """Tests of Repo.seed_fake_data row counts."""
+
+    def test_zero_rows_seeds_nothing(self):
+        counts = [self.count(entity) for entity in (User, Order, OrderProduct)]
+
+        self.repo.seed_fake_data(n=0)
+
+        self.assertEqual(
+            [self.count(entity) for entity in (User, Order, OrderProduct)], counts
+        )
+
+    def test_one_row_seeds_one_order(self):
+        orders, order_products = self.count(Order), self.count(OrderProduct)
+
+        self.repo.seed_fake_data(n=1, commit=False)
+
+        self.assertEqual(self.count(Order), orders + 1)
+        self.assertEqual(self.count(OrderProduct), order_products + 1)
+
+
+class StrictModeTest(RepoTestCase):
+    """Tests of relationship loading of Repo reads with and without SQL_STRICT."""
+
+    telegram_id = 987_654_321
+
+    def setUp(self):
+        super().setUp()
+        # one order with one product of a user unknown to the demo data.
+        self.repo.add_user(telegram_id=self.telegram_id, full_name="Strict Mode",
+                           language_code="en", commit=False)
+        order = self.repo.add_order(user_id=self.telegram_id, commit=False)
+        product = self.repo.add_product(title="strict mode product", description=None,
+                                        price=100, commit=False)
+        self.repo.add_order_product(order_id=order.order_id, product_id=product.product_id,
+                                    quantity=1, commit=False)
+        # the reads below build their objects again instead of reusing these.
+        self.session.expunge_all()
+
+        self.statements = []
+        event.listen(self.connection, "before_cursor_execute", self.count_statement)
+
+    def tearDown(self):
+        event.remove(self.connection, "before_cursor_execute", self.count_statement)
+        super().tearDown()
+
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_unloaded_relationship_is_lazy_loaded(self):
+        with mock.patch.dict(os.environ, {"SQL_STRICT": "0"}):
+            rows = self.repo.get_all_user_orders_no_relationships(telegram_id=self.telegram_id)
+        self.assertEqual(len(self.statements), 1)
+
+        # touching the products of the order emits one lazy load.
+        self.assertEqual(len(rows[0].Order.products), 1)
+        self.assertEqual(len(self.statements), 2)
+
+    def test_unloaded_relationship_raises_in_strict_mode(self):
+        with mock.patch.dict(os.environ, {"SQL_STRICT": "1"}):
+            rows = self.repo.get_all_user_orders_no_relationships(telegram_id=self.telegram_id)
+        self.assertEqual(len(self.statements), 1)
+
+        # touching the products of the order raises instead of a lazy load.
+        with self.assertRaises(InvalidRequestError):
+            rows[0].Order.products
+        self.assertEqual(len(self.statements), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()